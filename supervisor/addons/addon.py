@@ -801,9 +801,9 @@ class Addon(AddonModel):
         # Add to addon manager
         self.sys_addons.local[self.slug] = self
 
-        # Reload ingress tokens
-        if self.with_ingress:
-            await self.sys_ingress.reload()
+        # Register ingress token
+        if self.with_ingress and self.ingress_token:
+            self.sys_ingress.register_ingress_token(self.slug, self.ingress_token)
 
     @Job(
         name="addon_uninstall",
@@ -844,11 +844,12 @@ class Addon(AddonModel):
             self.ingress_panel = False
             with suppress(HomeAssistantAPIError):
                 await self.sys_ingress.update_hass_panel(self)
+        self.sys_ingress.forget_panel_state(self.slug)
 
         # Cleanup Ingress dynamic port assignment
-        need_ingress_token_cleanup = False
+        ingress_token: str | None = None
         if self.with_ingress:
-            need_ingress_token_cleanup = True
+            ingress_token = self.ingress_token
             await self.sys_ingress.del_dynamic_port(self.slug)
 
         # Cleanup discovery data
@@ -868,8 +869,8 @@ class Addon(AddonModel):
         await self.sys_addons.data.uninstall(self)
 
         # Cleanup Ingress tokens
-        if need_ingress_token_cleanup:
-            await self.sys_ingress.reload()
+        if ingress_token:
+            self.sys_ingress.unregister_ingress_token(ingress_token)
 
     @Job(
         name="addon_update",
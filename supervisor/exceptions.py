@@ -261,6 +261,13 @@ class UpdaterJobError(UpdaterError, JobException):
     """Raise on job error."""
 
 
+# Ingress
+
+
+class IngressError(HassioError):
+    """Raise on error with ingress."""
+
+
 # Auth
 
 
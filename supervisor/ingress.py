@@ -1,9 +1,14 @@
 """Fetch last versions from webserver."""
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, datetime
+import hashlib
 import logging
 import random
 import secrets
+import time
+from weakref import WeakValueDictionary
 
 from .addons.addon import Addon
 from .const import (
@@ -15,13 +20,31 @@ from .const import (
     IngressSessionDataDict,
 )
 from .coresys import CoreSys, CoreSysAttributes
+from .exceptions import IngressError
 from .utils import check_port
 from .utils.common import FileConfiguration
-from .utils.dt import utc_from_timestamp, utcnow
+from .utils.dt import utcnow
 from .validate import SCHEMA_INGRESS_CONFIG
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Highest timestamp a tz-aware datetime can represent
+_MAX_SESSION_TIMESTAMP: float = datetime.max.replace(tzinfo=UTC).timestamp()
+
+# Range used for dynamic ingress port allocation
+_DYNAMIC_PORT_RANGE = range(62000, 65501)
+
+# How long a session stays valid after creation or last use
+_SESSION_TTL_SECONDS: float = 900.0
+
+# Length of the hashed key a session token is stored under
+_SESSION_KEY_LENGTH = 32
+
+
+def _session_key(session: str) -> str:
+    """Return the storage key for a session token."""
+    return hashlib.sha256(session.encode()).hexdigest()[:_SESSION_KEY_LENGTH]
+
 
 class Ingress(FileConfiguration, CoreSysAttributes):
     """Fetch last versions from version.json."""
@@ -31,17 +54,64 @@ class Ingress(FileConfiguration, CoreSysAttributes):
         super().__init__(FILE_HASSIO_INGRESS, SCHEMA_INGRESS_CONFIG)
         self.coresys: CoreSys = coresys
         self.tokens: dict[str, str] = {}
+        self._allocated_ports: set[int] = set()
+        self._port_pool: list[int] = []
+        self._panel_state: dict[str, bool] = {}
+        self._session_data_cache: WeakValueDictionary[str, IngressSessionData] = (
+            WeakValueDictionary()
+        )
+        self._dirty: bool = False
+        self._flush_task: asyncio.Task | None = None
+
+    async def read_data(self) -> None:
+        """Read configuration file."""
+        await super().read_data()
+
+        # Re-key legacy sessions stored under the raw token
+        sessions = self.sessions
+        sessions_data = self.sessions_data
+        for session in [s for s in sessions if len(s) != _SESSION_KEY_LENGTH]:
+            key = _session_key(session)
+            sessions[key] = sessions.pop(session)
+            if (data := sessions_data.pop(session, None)) is not None:
+                sessions_data[key] = data
+
+        self._allocated_ports = set(self.ports.values())
+        self._port_pool = [
+            port for port in _DYNAMIC_PORT_RANGE if port not in self._allocated_ports
+        ]
+        random.shuffle(self._port_pool)
+
+    def _schedule_save(self) -> None:
+        """Schedule a debounced write of the config file."""
+        self._dirty = True
+        if self._flush_task and not self._flush_task.done():
+            return
+        self._flush_task = self.sys_create_task(self._flush_after(1.0))
+
+    async def _flush_after(self, delay: float) -> None:
+        """Write config data after a coalescing delay."""
+        await asyncio.sleep(delay)
+        # Loop to catch mutations that land while save_data is in progress
+        while self._dirty:
+            self._dirty = False
+            await self.save_data()
 
     def get(self, token: str) -> Addon | None:
         """Return addon they have this ingress token."""
-        if token not in self.tokens:
+        if (addon_slug := self.tokens.get(token)) is None:
             return None
-        return self.sys_addons.get_local_only(self.tokens[token])
+        return self.sys_addons.get_local_only(addon_slug)
 
     def get_session_data(self, session_id: str) -> IngressSessionData | None:
         """Return complementary data of current session or None."""
-        if data := self.sessions_data.get(session_id):
-            return IngressSessionData.from_dict(data)
+        key = _session_key(session_id)
+        if (cached := self._session_data_cache.get(key)) is not None:
+            return cached
+        if data := self.sessions_data.get(key):
+            session_data = IngressSessionData.from_dict(data)
+            self._session_data_cache[key] = session_data
+            return session_data
         return None
 
     @property
@@ -62,12 +132,11 @@ class Ingress(FileConfiguration, CoreSysAttributes):
     @property
     def addons(self) -> list[Addon]:
         """Return list of ingress Add-ons."""
-        addons = []
-        for addon in self.sys_addons.installed:
-            if not addon.with_ingress:
-                continue
-            addons.append(addon)
-        return addons
+        return list(self.iter_addons())
+
+    def iter_addons(self) -> Iterator[Addon]:
+        """Iterate over Add-ons with ingress support."""
+        return (addon for addon in self.sys_addons.installed if addon.with_ingress)
 
     async def load(self) -> None:
         """Update internal data."""
@@ -83,118 +152,144 @@ class Ingress(FileConfiguration, CoreSysAttributes):
 
     async def unload(self) -> None:
         """Shutdown sessions."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._dirty = False
         await self.save_data()
 
     def _cleanup_sessions(self) -> None:
         """Remove not used sessions."""
-        now = utcnow()
+        if not (sessions := self.sessions):
+            return
+
+        now_ts = utcnow().timestamp()
+        sessions_data = self.sessions_data
 
-        sessions = {}
-        sessions_data: dict[str, IngressSessionDataDict] = {}
-        for session, valid in self.sessions.items():
+        expired: list[str] = []
+        for session, valid in sessions.items():
             # check if timestamp valid, to avoid crash on malformed timestamp
-            try:
-                valid_dt = utc_from_timestamp(valid)
-            except OverflowError:
+            if valid > _MAX_SESSION_TIMESTAMP:
                 _LOGGER.warning("Session timestamp %f is invalid!", valid)
-                continue
+                expired.append(session)
+            elif valid < now_ts:
+                expired.append(session)
 
-            if valid_dt < now:
-                continue
-
-            # Is valid
-            sessions[session] = valid
-            if session_data := self.sessions_data.get(session):
-                sessions_data[session] = session_data
-
-        # Write back
-        self.sessions.clear()
-        self.sessions.update(sessions)
-        self.sessions_data.clear()
-        self.sessions_data.update(sessions_data)
+        # Drop expired sessions in place
+        for session in expired:
+            sessions.pop(session, None)
+            sessions_data.pop(session, None)
+            self._session_data_cache.pop(session, None)
 
     def _update_token_list(self) -> None:
         """Regenerate token <-> Add-on map."""
         self.tokens.clear()
 
         # Read all ingress token and build a map
-        for addon in self.addons:
+        for addon in self.iter_addons():
             if addon.ingress_token:
                 self.tokens[addon.ingress_token] = addon.slug
 
+    def register_ingress_token(self, slug: str, token: str) -> None:
+        """Map an ingress token to an installed add-on."""
+        self.tokens[token] = slug
+
+    def unregister_ingress_token(self, token: str) -> None:
+        """Remove an ingress token from the map."""
+        self.tokens.pop(token, None)
+
+    def forget_panel_state(self, addon_slug: str) -> None:
+        """Drop the cached panel state of an add-on."""
+        self._panel_state.pop(addon_slug, None)
+
     def create_session(self, data: IngressSessionData | None = None) -> str:
         """Create new session."""
-        session = secrets.token_hex(64)
-        valid = utcnow() + timedelta(minutes=15)
+        session = secrets.token_urlsafe(48)
+        key = _session_key(session)
 
-        self.sessions[session] = valid.timestamp()
+        self.sessions[key] = time.time() + _SESSION_TTL_SECONDS
         if data is not None:
-            self.sessions_data[session] = data.to_dict()
+            self.sessions_data[key] = data.to_dict()
 
         return session
 
     def validate_session(self, session: str) -> bool:
         """Return True if session valid and make it longer valid."""
-        if session not in self.sessions:
+        key = _session_key(session)
+        if (valid_until := self.sessions.get(key)) is None:
             _LOGGER.debug("Session %s is not known", session)
             return False
 
+        now_ts = time.time()
+
         # check if timestamp valid, to avoid crash on malformed timestamp
-        try:
-            valid_until = utc_from_timestamp(self.sessions[session])
-        except OverflowError:
-            self.sessions[session] = (utcnow() + timedelta(minutes=15)).timestamp()
+        if valid_until > _MAX_SESSION_TIMESTAMP:
+            self.sessions[key] = now_ts + _SESSION_TTL_SECONDS
             return True
 
         # Is still valid?
-        if valid_until < utcnow():
-            _LOGGER.debug("Session is no longer valid (%f/%f)", valid_until, utcnow())
+        if valid_until < now_ts:
+            _LOGGER.debug("Session is no longer valid (%f/%f)", valid_until, now_ts)
             return False
 
         # Update time
-        valid_until = valid_until + timedelta(minutes=15)
-        self.sessions[session] = valid_until.timestamp()
+        self.sessions[key] = valid_until + _SESSION_TTL_SECONDS
 
         return True
 
     async def get_dynamic_port(self, addon_slug: str) -> int:
         """Get/Create a dynamic port from range."""
-        if addon_slug in self.ports:
-            return self.ports[addon_slug]
+        if (existing := self.ports.get(addon_slug)) is not None:
+            return existing
+
+        port: int | None = None
+        busy: list[int] = []
+        while self._port_pool:
+            candidate = self._port_pool.pop()
+            if await check_port(self.sys_docker.network.gateway, candidate):
+                busy.append(candidate)
+                continue
+            port = candidate
+            break
+
+        # Keep ports busy on the host in the pool as last resort candidates
+        self._port_pool[:0] = busy
 
-        port = None
-        while (
-            port is None
-            or port in self.ports.values()
-            or await check_port(self.sys_docker.network.gateway, port)
-        ):
-            port = random.randint(62000, 65500)
+        if port is None:
+            raise IngressError("No free dynamic ingress port available!")
 
         # Save port for next time
+        self._allocated_ports.add(port)
         self.ports[addon_slug] = port
-        await self.save_data()
+        self._schedule_save()
         return port
 
     async def del_dynamic_port(self, addon_slug: str) -> None:
         """Remove a previously assigned dynamic port."""
-        if addon_slug not in self.ports:
+        if (port := self.ports.pop(addon_slug, None)) is None:
             return
 
-        del self.ports[addon_slug]
-        await self.save_data()
+        self._allocated_ports.discard(port)
+        self._port_pool.insert(random.randrange(len(self._port_pool) + 1), port)
+        self._schedule_save()
 
     async def update_hass_panel(self, addon: Addon):
         """Return True if Home Assistant up and running."""
+        desired = bool(addon.ingress_panel)
+        if self._panel_state.get(addon.slug) == desired:
+            _LOGGER.debug("Ingress panel for %s is already up-to-date", addon.slug)
+            return
+
         if not await self.sys_homeassistant.core.is_running():
             _LOGGER.debug("Ignoring panel update on Core")
             return
 
         # Update UI
-        method = "post" if addon.ingress_panel else "delete"
+        method = "post" if desired else "delete"
         async with self.sys_homeassistant.api.make_request(
             method, f"api/hassio_push/panel/{addon.slug}"
         ) as resp:
             if resp.status in (200, 201):
+                self._panel_state[addon.slug] = desired
                 _LOGGER.info("Update Ingress as panel for %s", addon.slug)
             else:
                 _LOGGER.warning(
@@ -30,6 +30,13 @@ class PluginManager(CoreSysAttributes):
         self._audio: PluginAudio = PluginAudio(coresys)
         self._observer: PluginObserver = PluginObserver(coresys)
         self._multicast: PluginMulticast = PluginMulticast(coresys)
+        self._all_plugins: tuple[PluginBase, ...] = (
+            self._cli,
+            self._dns,
+            self._audio,
+            self._observer,
+            self._multicast,
+        )
 
     async def load_config(self) -> Self:
         """Load config in executor."""
@@ -37,9 +44,9 @@ class PluginManager(CoreSysAttributes):
         return self
 
     @property
-    def all_plugins(self) -> list[PluginBase]:
-        """Return cli handler."""
-        return [self._cli, self._dns, self._audio, self._observer, self._multicast]
+    def all_plugins(self) -> tuple[PluginBase, ...]:
+        """Return all plugins."""
+        return self._all_plugins
 
     @property
     def cli(self) -> PluginCli:
@@ -66,70 +73,95 @@ class PluginManager(CoreSysAttributes):
         """Return multicast handler."""
         return self._multicast
 
+    async def _load_plugin(self, plugin: PluginBase) -> None:
+        """Load one plugin and handle errors."""
+        try:
+            await plugin.load()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Can't load plugin %s: %s", plugin.slug, err)
+            self.sys_resolution.create_issue(
+                IssueType.FATAL_ERROR,
+                ContextType.PLUGIN,
+                reference=plugin.slug,
+                suggestions=[SuggestionType.EXECUTE_REPAIR],
+            )
+            await async_capture_exception(err)
+
     async def load(self) -> None:
         """Load Supervisor plugins."""
-        # Sequential to avoid issue on slow IO
-        for plugin in self.all_plugins:
-            try:
-                await plugin.load()
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Can't load plugin %s: %s", plugin.slug, err)
-                self.sys_resolution.create_issue(
-                    IssueType.FATAL_ERROR,
-                    ContextType.PLUGIN,
-                    reference=plugin.slug,
-                    suggestions=[SuggestionType.EXECUTE_REPAIR],
-                )
-                await async_capture_exception(err)
+        # Each plugin load is independent Docker I/O, run them in parallel
+        await asyncio.gather(
+            *[self._load_plugin(plugin) for plugin in self.all_plugins],
+            return_exceptions=True,
+        )
 
         # Exit if supervisor out of date. Plugins can't update until then
         if self.sys_supervisor.need_update:
             return
 
         # Check requirements
-        for plugin in self.all_plugins:
-            # Check if need an update
-            if not plugin.need_update:
-                continue
+        to_update = [plugin for plugin in self.all_plugins if plugin.need_update]
+        if not to_update:
+            return
 
-            _LOGGER.info(
-                "Plugin %s is not up-to-date, latest version %s, updating",
+        # Image pulls are independent per plugin, run them in parallel
+        await asyncio.gather(
+            *[self._update_plugin(plugin) for plugin in to_update],
+            return_exceptions=True,
+        )
+
+    async def _update_plugin(self, plugin: PluginBase) -> None:
+        """Update one plugin and handle errors."""
+        _LOGGER.info(
+            "Plugin %s is not up-to-date, latest version %s, updating",
+            plugin.slug,
+            plugin.latest_version,
+        )
+        try:
+            await plugin.update()
+        except HassioError as ex:
+            _LOGGER.error(
+                "Can't update %s to %s: %s",
                 plugin.slug,
                 plugin.latest_version,
+                str(ex),
             )
-            try:
-                await plugin.update()
-            except HassioError as ex:
-                _LOGGER.error(
-                    "Can't update %s to %s: %s",
-                    plugin.slug,
-                    plugin.latest_version,
-                    str(ex),
-                )
-                self.sys_resolution.create_issue(
-                    IssueType.UPDATE_FAILED,
-                    ContextType.PLUGIN,
-                    reference=plugin.slug,
-                    suggestions=[SuggestionType.EXECUTE_UPDATE],
-                )
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Can't update plugin %s: %s", plugin.slug, err)
-                await async_capture_exception(err)
+            self.sys_resolution.create_issue(
+                IssueType.UPDATE_FAILED,
+                ContextType.PLUGIN,
+                reference=plugin.slug,
+                suggestions=[SuggestionType.EXECUTE_UPDATE],
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Can't update plugin %s: %s", plugin.slug, err)
+            await async_capture_exception(err)
 
     async def repair(self) -> None:
         """Repair Supervisor plugins."""
-        await asyncio.wait(
-            [self.sys_create_task(plugin.repair()) for plugin in self.all_plugins]
+        results = await asyncio.gather(
+            *[plugin.repair() for plugin in self.all_plugins], return_exceptions=True
         )
+        for plugin, result in zip(self.all_plugins, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Can't repair plugin %s: %s", plugin.slug, result)
+                await async_capture_exception(result)
+
+    async def _stop_plugin(self, plugin: PluginBase) -> None:
+        """Stop one plugin and handle errors."""
+        try:
+            await plugin.stop()
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Can't stop plugin %s: %s", plugin.slug, err)
+            await async_capture_exception(err)
 
     async def shutdown(self) -> None:
         """Shutdown Supervisor plugin."""
-        # Sequential to avoid issue on slow IO
-        for plugin in (
-            plugin for plugin in self.all_plugins if plugin.slug != "observer"
-        ):
-            try:
-                await plugin.stop()
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Can't stop plugin %s: %s", plugin.slug, err)
-                await async_capture_exception(err)
+        # Container stops are independent, run them in parallel
+        await asyncio.gather(
+            *[
+                self._stop_plugin(plugin)
+                for plugin in self.all_plugins
+                if plugin.slug != "observer"
+            ],
+            return_exceptions=True,
+        )
@@ -63,6 +63,7 @@ docker_image = vol.Match(
 uuid_match = vol.Match(r"^[0-9a-f]{32}$")
 sha256 = vol.Match(r"^[0-9a-f]{64}$")
 token = vol.Match(r"^[0-9a-f]{32,256}$")
+session_token = vol.Match(r"^[0-9a-zA-Z_-]{32,256}$")
 
 
 def version_tag(
@@ -191,7 +192,7 @@ SCHEMA_AUTH_CONFIG = vol.Schema({sha256: sha256})
 
 SCHEMA_SESSION_DATA = vol.Schema(
     {
-        token: vol.Schema(
+        session_token: vol.Schema(
             {
                 vol.Required(ATTR_SESSION_DATA_USER): vol.Schema(
                     {
@@ -208,7 +209,7 @@ SCHEMA_SESSION_DATA = vol.Schema(
 SCHEMA_INGRESS_CONFIG = vol.Schema(
     {
         vol.Required(ATTR_SESSION, default=dict): vol.Schema(
-            {token: vol.Coerce(float)}
+            {session_token: vol.Coerce(float)}
         ),
         vol.Required(ATTR_SESSION_DATA, default=dict): SCHEMA_SESSION_DATA,
         vol.Required(ATTR_PORTS, default=dict): vol.Schema({str: network_port}),
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch
 from aiohttp.test_utils import TestClient
 
 from supervisor.coresys import CoreSys
+from supervisor.ingress import _session_key
 
 
 async def test_validate_session(api_client: TestClient, coresys: CoreSys):
@@ -25,9 +26,10 @@ async def test_validate_session(api_client: TestClient, coresys: CoreSys):
 
         assert "session" in result["data"]
         session = result["data"]["session"]
-        assert session in coresys.ingress.sessions
+        session_key = _session_key(session)
+        assert session_key in coresys.ingress.sessions
 
-        valid_time = coresys.ingress.sessions[session]
+        valid_time = coresys.ingress.sessions[session_key]
 
         resp = await api_client.post(
             "/ingress/validate_session",
@@ -36,7 +38,7 @@ async def test_validate_session(api_client: TestClient, coresys: CoreSys):
         assert resp.status == 200
         assert await resp.json() == {"result": "ok", "data": {}}
 
-        assert coresys.ingress.sessions[session] > valid_time
+        assert coresys.ingress.sessions[session_key] > valid_time
 
 
 async def test_validate_session_with_user_id(
@@ -67,9 +69,10 @@ async def test_validate_session_with_user_id(
 
         assert "session" in result["data"]
         session = result["data"]["session"]
-        assert session in coresys.ingress.sessions
+        session_key = _session_key(session)
+        assert session_key in coresys.ingress.sessions
 
-        valid_time = coresys.ingress.sessions[session]
+        valid_time = coresys.ingress.sessions[session_key]
 
         resp = await api_client.post(
             "/ingress/validate_session",
@@ -78,9 +81,9 @@ async def test_validate_session_with_user_id(
         assert resp.status == 200
         assert await resp.json() == {"result": "ok", "data": {}}
 
-        assert coresys.ingress.sessions[session] > valid_time
+        assert coresys.ingress.sessions[session_key] > valid_time
 
-        assert session in coresys.ingress.sessions_data
+        assert session_key in coresys.ingress.sessions_data
         assert coresys.ingress.get_session_data(session).user.id == "some-id"
         assert coresys.ingress.get_session_data(session).user.username == "sn"
         assert (
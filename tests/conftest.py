@@ -409,7 +409,11 @@ async def coresys(
         coresys_obj.init_websession = AsyncMock()
 
     # Don't remove files/folders related to addons and stores
-    with patch("supervisor.store.git.GitRepo._remove"):
+    # Don't probe the (not existing) docker gateway for dynamic ingress ports
+    with (
+        patch("supervisor.store.git.GitRepo._remove"),
+        patch("supervisor.ingress.check_port", new=AsyncMock(return_value=False)),
+    ):
         yield coresys_obj
 
     await coresys_obj.dbus.unload()
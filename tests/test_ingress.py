@@ -6,24 +6,25 @@ from unittest.mock import ANY, patch
 
 from supervisor.const import IngressSessionData, IngressSessionDataUser
 from supervisor.coresys import CoreSys
-from supervisor.ingress import Ingress
-from supervisor.utils.dt import utc_from_timestamp
-from supervisor.utils.json import read_json_file
+from supervisor.ingress import Ingress, _session_key
+from supervisor.utils.dt import utc_from_timestamp, utcnow
+from supervisor.utils.json import read_json_file, write_json_file
 
 
 def test_session_handling(coresys: CoreSys):
     """Create and test session."""
     session = coresys.ingress.create_session()
-    validate = coresys.ingress.sessions[session]
+    session_key = _session_key(session)
+    validate = coresys.ingress.sessions[session_key]
 
     assert session
     assert validate
 
     assert coresys.ingress.validate_session(session)
-    assert coresys.ingress.sessions[session] != validate
+    assert coresys.ingress.sessions[session_key] != validate
 
     not_valid = utc_from_timestamp(validate) - timedelta(minutes=20)
-    coresys.ingress.sessions[session] = not_valid.timestamp()
+    coresys.ingress.sessions[session_key] = not_valid.timestamp()
     assert not coresys.ingress.validate_session(session)
     assert not coresys.ingress.validate_session("invalid session")
 
@@ -56,7 +57,6 @@ async def test_dynamic_ports(coresys: CoreSys):
     port_test1 = await coresys.ingress.get_dynamic_port("test1")
 
     assert port_test1
-    assert coresys.ingress.save_data.called
     assert port_test1 == await coresys.ingress.get_dynamic_port("test1")
 
     port_test2 = await coresys.ingress.get_dynamic_port("test2")
@@ -69,6 +69,39 @@ async def test_dynamic_ports(coresys: CoreSys):
     assert port_test1 >= 62000
     assert port_test1 <= 65500
 
+    # Port changes are written back with a debounced flush
+    await coresys.ingress.unload()
+    assert coresys.ingress.save_data.called
+
+
+async def test_dynamic_port_save_debounce(coresys: CoreSys):
+    """Test port changes are written by the flush task without unload."""
+    with patch("supervisor.ingress.asyncio.sleep") as sleep:
+        await coresys.ingress.get_dynamic_port("test1")
+        assert not coresys.ingress.save_data.called
+
+        await coresys.ingress._flush_task
+
+    assert sleep.called
+    assert coresys.ingress.save_data.called
+
+
+async def test_dynamic_port_flush_dirtied_during_save(coresys: CoreSys):
+    """Test a port change landing during the save is flushed again."""
+
+    async def del_port_during_save():
+        if coresys.ingress.save_data.call_count == 1:
+            await coresys.ingress.del_dynamic_port("test1")
+
+    coresys.ingress.save_data.side_effect = del_port_during_save
+
+    with patch("supervisor.ingress.asyncio.sleep"):
+        await coresys.ingress.get_dynamic_port("test1")
+        await coresys.ingress._flush_task
+
+    assert coresys.ingress.save_data.call_count == 2
+    assert not coresys.ingress._dirty
+
 
 async def test_ingress_save_data(coresys: CoreSys, tmp_supervisor_data: Path):
     """Test saving ingress data to file."""
@@ -85,20 +118,61 @@ async def test_ingress_save_data(coresys: CoreSys, tmp_supervisor_data: Path):
         return read_json_file(config_file)
 
     assert await coresys.run_in_executor(get_config) == {
-        "session": {session: ANY},
+        "session": {_session_key(session): ANY},
         "session_data": {
-            session: {"user": {"id": "123", "displayname": "Test", "username": "test"}}
+            _session_key(session): {
+                "user": {"id": "123", "displayname": "Test", "username": "test"}
+            }
         },
         "ports": {},
     }
 
 
+async def test_ingress_rekeys_legacy_sessions(
+    coresys: CoreSys, tmp_supervisor_data: Path
+):
+    """Test sessions stored under the raw token are re-keyed on load."""
+    legacy_session = "ab" * 64
+    config_file = tmp_supervisor_data / "ingress.json"
+
+    def write_config():
+        write_json_file(
+            config_file,
+            {
+                "session": {legacy_session: utcnow().timestamp() + 900},
+                "session_data": {
+                    legacy_session: {
+                        "user": {
+                            "id": "123",
+                            "displayname": "Test",
+                            "username": "test",
+                        }
+                    }
+                },
+                "ports": {},
+            },
+        )
+
+    await coresys.run_in_executor(write_config)
+
+    with patch("supervisor.ingress.FILE_HASSIO_INGRESS", new=config_file):
+        ingress = await Ingress(coresys).load_config()
+
+    assert legacy_session not in ingress.sessions
+    assert _session_key(legacy_session) in ingress.sessions
+    assert _session_key(legacy_session) in ingress.sessions_data
+
+    assert ingress.validate_session(legacy_session)
+    assert ingress.get_session_data(legacy_session).user.id == "123"
+
+
 async def test_ingress_reload_ignore_none_data(coresys: CoreSys):
     """Test reloading ingress does not add None for session data and create errors."""
     session = coresys.ingress.create_session()
-    assert session in coresys.ingress.sessions
-    assert session not in coresys.ingress.sessions_data
+    session_key = _session_key(session)
+    assert session_key in coresys.ingress.sessions
+    assert session_key not in coresys.ingress.sessions_data
 
     await coresys.ingress.reload()
-    assert session in coresys.ingress.sessions
-    assert session not in coresys.ingress.sessions_data
+    assert session_key in coresys.ingress.sessions
+    assert session_key not in coresys.ingress.sessions_data